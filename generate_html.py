@@ -1,17 +1,66 @@
+import asyncio
 import feedparser
+import httpx
 import re
 from datetime import datetime, timedelta
 import html
-from rapidfuzz import fuzz
 from collections import defaultdict
-import hashlib
 import string
 import os
+import calendar
+import time
+import shutil
+import json
+from glob import glob
+import shelve
+import urllib.parse
+from functools import lru_cache
+
+def google_news_rss_url(query):
+    q = urllib.parse.quote_plus(query)
+    return f"https://news.google.com/rss/search?q={q}&hl=en-US&gl=US&ceid=US:en"
+
+RSS_CACHE_PATH = ".rss_cache"
+
+async def fetch_feed(client, cache, sector, query):
+    """Conditionally GET one feed, falling back to the cached bytes on 304 or any failure"""
+    cached = cache.get(query, {})
+    headers = {}
+    if cached.get("etag"):
+        headers["If-None-Match"] = cached["etag"]
+    if cached.get("last_modified"):
+        headers["If-Modified-Since"] = cached["last_modified"]
+
+    try:
+        response = await client.get(google_news_rss_url(query), headers=headers)
+    except httpx.HTTPError as e:
+        # Serve the last good copy (stale items are dropped by the 24h cutoff);
+        # an empty body parses to a feed with no entries
+        print(f"[⚠️] Failed to fetch {sector} feed: {e!r}")
+        return cached.get("content", b"")
+
+    if response.status_code == 304:
+        return cached.get("content", b"")
+
+    if response.status_code != 200:
+        print(f"[⚠️] Failed to fetch {sector} feed: HTTP {response.status_code}")
+        return cached.get("content", b"")
+
+    cache[query] = {
+        "etag": response.headers.get("etag"),
+        "last_modified": response.headers.get("last-modified"),
+        "content": response.content,
+    }
+    return response.content
 
-def google_news_rss(query):
-    q = query.replace(" ", "+")
-    url = f"https://news.google.com/rss/search?q={q}&hl=en-US&gl=US&ceid=US:en"
-    return feedparser.parse(url)
+async def fetch_feeds(queries):
+    """Fetch all sector RSS feeds concurrently over one HTTP/2 client and parse the raw bytes"""
+    with shelve.open(RSS_CACHE_PATH) as cache:
+        async with httpx.AsyncClient(http2=True, timeout=10, follow_redirects=True) as client:
+            contents = await asyncio.gather(
+                *(fetch_feed(client, cache, sector, query) for sector, query in queries.items())
+            )
+    return {sector: feedparser.parse(content) for sector, content in zip(queries, contents)}
 
 sector_queries = {
     "Consumer & Retail": '("acquires" OR "acquisition" OR "merger" OR "buys") AND (consumer OR retail OR fashion OR food)',
@@ -20,60 +69,56 @@ sector_queries = {
     "Business Services": '("acquires" OR "acquisition") AND ("business services" OR B2B OR outsourcing)',
 }
 
-def create_deal_signature(title, source):
-    """Create a unique signature for exact duplicate detection"""
-    # Clean title for signature
-    clean_title = re.sub(r'\s*-\s*[A-Z][a-zA-Z\s&.]+$', '', title)  # Remove source suffix
-    clean_title = re.sub(r'\s+', ' ', clean_title).strip().lower()
-    
-    # Create signature from title + source
-    signature = f"{clean_title}|{source.lower()}"
-    return hashlib.md5(signature.encode()).hexdigest()
+SOURCE_SUFFIX_RE = re.compile(r'\s*-\s*[A-Z][a-zA-Z\s&.]+$')
+REPORTS_PREFIX_RE = re.compile(r'^(reports?:?\s*|report\s+says:?\s*)', re.IGNORECASE)
+REPORTS_SUFFIX_RE = re.compile(r'(,?\s*report\s+says?|,?\s*reports?)$', re.IGNORECASE)
+ENTITY_SUFFIX_RE = re.compile(r'\s+(Inc|Corp|Ltd|LLC|Group|Holdings?|Co)\.?$', re.IGNORECASE)
+
+# Patterns to extract acquirer, target, and deal type
+DEAL_PATTERNS = [
+    # Standard: "Company A acquires Company B"
+    (re.compile(r'([A-Z][a-zA-Z\s&.\'\-]+?)\s+(acquires?|buys?)\s+([A-Z][a-zA-Z\s&.\'\-]+?)(?:\s+(?:for|to|from|in|$))', re.IGNORECASE), 'acquisition'),
+
+    # Board approval: "Company board approves acquisition of Target"
+    (re.compile(r'([A-Z][a-zA-Z\s&.\'\-]+?)\s+board\s+approves\s+acquisition\s+of\s+([A-Z][a-zA-Z\s&.\'\-]+?)(?:\s+(?:for|to|from|in|$))', re.IGNORECASE), 'acquisition'),
+
+    # Board approval reversed: "Board of Company approves acquisition of Target"
+    (re.compile(r'board\s+of\s+([A-Z][a-zA-Z\s&.\'\-]+?)\s+approves\s+acquisition\s+of\s+([A-Z][a-zA-Z\s&.\'\-]+?)(?:\s+(?:for|to|from|in|$))', re.IGNORECASE), 'acquisition'),
+
+    # Talks: "Company A in talks to acquire Company B"
+    (re.compile(r'([A-Z][a-zA-Z\s&.\'\-]+?)\s+in\s+talks\s+to\s+acquire\s+([A-Z][a-zA-Z\s&.\'\-]+?)(?:\s+(?:for|to|from|in|$))', re.IGNORECASE), 'acquisition'),
+
+    # Mulling: "Company A mulling acquisition of Company B"
+    (re.compile(r'([A-Z][a-zA-Z\s&.\'\-]+?)\s+mulling\s+acquisition\s+of\s+([A-Z][a-zA-Z\s&.\'\-]+?)(?:\s+(?:for|to|from|in|$))', re.IGNORECASE), 'acquisition'),
+
+    # Takeover interest: "Company B draws takeover interest from Company A"
+    (re.compile(r'([A-Z][a-zA-Z\s&.\'\-]+?)\s+draws\s+takeover\s+interest\s+from\s+([A-Z][a-zA-Z\s&.\'\-]+?)(?:\s+(?:for|to|from|in|$))', re.IGNORECASE), 'acquisition'),
+
+    # Completion: "Company A completes acquisition of Company B"
+    (re.compile(r'([A-Z][a-zA-Z\s&.\'\-]+?)\s+completes?\s+(?:\d+\w+\s+)?acquisition\s+(?:of\s+|with\s+)?([A-Z][a-zA-Z\s&.\'\-]+?)(?:\s+(?:for|to|from|in|$))', re.IGNORECASE), 'acquisition'),
 
+    # Expands through: "Company A expands portfolio through acquisition of Company B"
+    (re.compile(r'([A-Z][a-zA-Z\s&.\'\-]+?)\s+expands?.*?through.*?acquisition\s+of\s+([A-Z][a-zA-Z\s&.\'\-]+?)(?:\s+(?:for|to|from|in|$))', re.IGNORECASE), 'acquisition'),
+]
+
+@lru_cache(maxsize=None)
 def extract_deal_entities(title):
     """Extract company names and deal type from title"""
     # Remove source attribution and common prefixes
-    title = re.sub(r'\s*-\s*[A-Z][a-zA-Z\s&.]+$', '', title)
-    title = re.sub(r'^(reports?:?\s*|report\s+says:?\s*)', '', title, flags=re.IGNORECASE)
-    title = re.sub(r'(,?\s*report\s+says?|,?\s*reports?)$', '', title, flags=re.IGNORECASE)
-    
-    # Patterns to extract acquirer, target, and deal type
-    patterns = [
-        # Standard: "Company A acquires Company B"
-        (r'([A-Z][a-zA-Z\s&.\'\-]+?)\s+(acquires?|buys?)\s+([A-Z][a-zA-Z\s&.\'\-]+?)(?:\s+(?:for|to|from|in|$))', 'acquisition'),
-        
-        # Board approval: "Company board approves acquisition of Target"
-        (r'([A-Z][a-zA-Z\s&.\'\-]+?)\s+board\s+approves\s+acquisition\s+of\s+([A-Z][a-zA-Z\s&.\'\-]+?)(?:\s+(?:for|to|from|in|$))', 'acquisition'),
-        
-        # Board approval reversed: "Board of Company approves acquisition of Target"
-        (r'board\s+of\s+([A-Z][a-zA-Z\s&.\'\-]+?)\s+approves\s+acquisition\s+of\s+([A-Z][a-zA-Z\s&.\'\-]+?)(?:\s+(?:for|to|from|in|$))', 'acquisition'),
-        
-        # Talks: "Company A in talks to acquire Company B"
-        (r'([A-Z][a-zA-Z\s&.\'\-]+?)\s+in\s+talks\s+to\s+acquire\s+([A-Z][a-zA-Z\s&.\'\-]+?)(?:\s+(?:for|to|from|in|$))', 'acquisition'),
-        
-        # Mulling: "Company A mulling acquisition of Company B"
-        (r'([A-Z][a-zA-Z\s&.\'\-]+?)\s+mulling\s+acquisition\s+of\s+([A-Z][a-zA-Z\s&.\'\-]+?)(?:\s+(?:for|to|from|in|$))', 'acquisition'),
-        
-        # Takeover interest: "Company B draws takeover interest from Company A"
-        (r'([A-Z][a-zA-Z\s&.\'\-]+?)\s+draws\s+takeover\s+interest\s+from\s+([A-Z][a-zA-Z\s&.\'\-]+?)(?:\s+(?:for|to|from|in|$))', 'acquisition'),
-        
-        # Completion: "Company A completes acquisition of Company B"
-        (r'([A-Z][a-zA-Z\s&.\'\-]+?)\s+completes?\s+(?:\d+\w+\s+)?acquisition\s+(?:of\s+|with\s+)?([A-Z][a-zA-Z\s&.\'\-]+?)(?:\s+(?:for|to|from|in|$))', 'acquisition'),
-        
-        # Expands through: "Company A expands portfolio through acquisition of Company B"
-        (r'([A-Z][a-zA-Z\s&.\'\-]+?)\s+expands?.*?through.*?acquisition\s+of\s+([A-Z][a-zA-Z\s&.\'\-]+?)(?:\s+(?:for|to|from|in|$))', 'acquisition'),
-    ]
+    title = SOURCE_SUFFIX_RE.sub('', title)
+    title = REPORTS_PREFIX_RE.sub('', title)
+    title = REPORTS_SUFFIX_RE.sub('', title)
     
-    for pattern, deal_type in patterns:
-        match = re.search(pattern, title, re.IGNORECASE)
+    for pattern, deal_type in DEAL_PATTERNS:
+        match = pattern.search(title)
         if match:
             entity1 = match.group(1).strip()
             entity2 = match.group(2).strip() if len(match.groups()) > 1 else None
             
             # Clean up entities
-            entity1 = re.sub(r'\s+(Inc|Corp|Ltd|LLC|Group|Holdings?|Co)\.?$', '', entity1, flags=re.IGNORECASE)
+            entity1 = ENTITY_SUFFIX_RE.sub('', entity1)
             if entity2:
-                entity2 = re.sub(r'\s+(Inc|Corp|Ltd|LLC|Group|Holdings?|Co)\.?$', '', entity2, flags=re.IGNORECASE)
+                entity2 = ENTITY_SUFFIX_RE.sub('', entity2)
             
             # Handle special cases where target and acquirer are swapped
             if 'draws takeover interest from' in title.lower():
@@ -83,67 +128,27 @@ def extract_deal_entities(title):
     
     return None, None, None
 
-def calculate_deal_similarity(deal1, deal2):
-    """Calculate similarity between two deals using multiple methods"""
-    
-    # Extract entities from both deals
-    acquirer1, target1, type1 = extract_deal_entities(deal1['title'])
-    acquirer2, target2, type2 = extract_deal_entities(deal2['title'])
-    
-    # Method 1: Exact entity match
-    if acquirer1 and target1 and acquirer2 and target2:
-        if acquirer1 == acquirer2 and target1 == target2:
-            return 100  # Perfect match
-        
-        # Check for partial matches (same acquirer, different target names for same company)
-        if acquirer1 == acquirer2:
-            target_similarity = fuzz.ratio(target1, target2)
-            if target_similarity >= 80:
-                return 95  # Very high confidence same deal
-    
-    # Method 2: Fuzzy title matching after normalization
-    def normalize_title(title):
-        # Remove source attribution
-        title = re.sub(r'\s*-\s*[A-Z][a-zA-Z\s&.]+$', '', title)
-        # Remove report says, etc.
-        title = re.sub(r'^(reports?:?\s*|report\s+says:?\s*)', '', title, flags=re.IGNORECASE)
-        title = re.sub(r'(,?\s*report\s+says?|,?\s*reports?)$', '', title, flags=re.IGNORECASE)
-        
-        # Normalize acquisition language
-        replacements = [
-            ('mulling acquisition of', 'acquires'),
-            ('in talks to acquire', 'acquires'),
-            ('draws takeover interest from', 'target of'),
-            ('board approves acquisition of', 'acquires'),
-            ('completes acquisition of', 'acquires'),
-            ('to acquire', 'acquires'),
-            ('buys', 'acquires'),
-        ]
-        
-        for old, new in replacements:
-            title = re.sub(r'\b' + re.escape(old) + r'\b', new, title, flags=re.IGNORECASE)
-        
-        return re.sub(r'\s+', ' ', title).strip().lower()
-    
-    norm1 = normalize_title(deal1['title'])
-    norm2 = normalize_title(deal2['title'])
-    
-    title_similarity = fuzz.ratio(norm1, norm2)
-    
-    # Method 3: Token-based similarity
-    tokens1 = set(re.findall(r'\b[a-zA-Z]{3,}\b', norm1))
-    tokens2 = set(re.findall(r'\b[a-zA-Z]{3,}\b', norm2))
-    
-    if tokens1 and tokens2:
-        intersection = len(tokens1 & tokens2)
-        union = len(tokens1 | tokens2)
-        jaccard = (intersection / union) * 100 if union > 0 else 0
-        
-        # Combine title similarity and token similarity
-        combined_similarity = max(title_similarity, jaccard)
-        return combined_similarity
-    
-    return title_similarity
+# Source priority when picking a cluster's representative (higher wins)
+PREFERRED_SOURCES = {
+    'Bloomberg': 10, 'Reuters': 9, 'Financial Times': 9, 'Wall Street Journal': 9,
+    'CNBC': 8, 'MarketWatch': 8, 'Yahoo Finance': 8, 'Forbes': 8,
+    'TechCrunch': 7, 'Business Standard': 7, 'CNBC TV18': 7
+}
+
+NOISE_SOURCES = {
+    'Stocktwits', 'MSN', 'Seeking Alpha', 'The Motley Fool', 'Benzinga',
+    'InvestorPlace', 'Zacks', 'TipRanks', 'Finbold', 'CoinCentral'
+}
+
+SKIP_TITLE_PHRASES = [
+    'stock jumps', 'stock soars', 'shares surge', 'ipo', 'lawsuit', 'dividend',
+    'price target', 'earnings', 'fraud', 'downgrade', 'upgrade',
+    'luxury item', 'auction', 'resident buys', 'retail space'
+]
+
+# Substring blacklists folded into one case-insensitive scan per string
+NOISE_SOURCES_RE = re.compile('|'.join(map(re.escape, NOISE_SOURCES)), re.IGNORECASE)
+SKIP_TITLE_RE = re.compile('|'.join(map(re.escape, SKIP_TITLE_PHRASES)), re.IGNORECASE)
 
 STOPWORDS = {
     'the', 'and', 'of', 'to', 'in', 'a', 'on', 'for', 'at', 'with', 'as',
@@ -152,17 +157,63 @@ STOPWORDS = {
     'acquires', 'acquisition', 'takeover', 'merger', 'company', 'firm', 'group'
 }
 
+# Gazetteer of company-name tokens used to spot org-word overlap between titles
+ORG_GAZETTEER = frozenset({
+    'us', 'foods', 'performance', 'dodla', 'dairy', 'nvidia', 'becu',
+    'openai', 'symplr', 'amn', 'healthcare', 'clarity', 'ecolytiq',
+    'xealth', 'samsung', 'intuit', 'relevvo', 'pet', 'nutrition',
+    'sopral', 'pupil', 'morliny'
+})
+
+PUNCTUATION_TABLE = str.maketrans('', '', string.punctuation)
+
+@lru_cache(maxsize=None)
 def normalize(title):
-    title = title.lower().translate(str.maketrans('', '', string.punctuation))
-    words = set(w for w in title.split() if w not in STOPWORDS)
-    org_words = set(w for w in words if w in {
-        'us', 'foods', 'performance', 'dodla', 'dairy', 'nvidia', 'becu',
-        'openai', 'symplr', 'amn', 'healthcare', 'clarity', 'ecolytiq',
-        'xealth', 'samsung', 'intuit', 'relevvo', 'pet', 'nutrition',
-        'sopral', 'pupil', 'morliny'
-    })
+    words = frozenset(title.lower().translate(PUNCTUATION_TABLE).split()) - STOPWORDS
+    org_words = words & ORG_GAZETTEER
     return words, org_words
 
+def find_similar_pairs(titles_normalized):
+    """Score candidate title pairs once and return, per title, the later titles it matches"""
+    # Pack each word set into an int bitmask over a shared vocabulary so that
+    # overlap counting is a single AND + popcount instead of a set intersection
+    vocab = {}
+
+    def pack(tokens):
+        bits = 0
+        for token in tokens:
+            bits |= 1 << vocab.setdefault(token, len(vocab))
+        return bits
+
+    word_bits = [pack(words) for words, _ in titles_normalized]
+    org_bits = [pack(org_words) for _, org_words in titles_normalized]
+    similar_to = [[] for _ in titles_normalized]
+
+    # Block on shared words: org words are a subset of words, so titles with
+    # no word in common can never match and are never scored
+    postings = defaultdict(list)
+    for i, (words, _) in enumerate(titles_normalized):
+        for word in words:
+            postings[word].append(i)
+
+    for i, (base_words, base_org) in enumerate(zip(word_bits, org_bits)):
+        candidates = set()
+        for word in titles_normalized[i][0]:
+            candidates.update(postings[word])
+
+        for j in sorted(c for c in candidates if c > i):
+            word_overlap = (base_words & word_bits[j]).bit_count()
+            org_overlap = (base_org & org_bits[j]).bit_count()
+
+            if word_overlap >= 3 or org_overlap >= 2:
+                similar_to[i].append(j)
+
+    return similar_to
+
+def source_score(deal):
+    """Sort key preferring higher-ranked sources, then longer titles"""
+    return -PREFERRED_SOURCES.get(deal['source'], 0), -len(deal['title'])
+
 def deduplicate_deals(deals):
     print(f"[🧹] Starting deduplication of {len(deals)} deals...")
 
@@ -178,28 +229,12 @@ def deduplicate_deals(deals):
     print(f"[🧹] After removing exact duplicates: {len(unique_deals)} deals")
 
     # 2. Filter noisy sources
-    preferred_sources = {
-        'Bloomberg': 10, 'Reuters': 9, 'Financial Times': 9, 'Wall Street Journal': 9,
-        'CNBC': 8, 'MarketWatch': 8, 'Yahoo Finance': 8, 'Forbes': 8,
-        'TechCrunch': 7, 'Business Standard': 7, 'CNBC TV18': 7
-    }
-
-    noise_sources = {
-        'Stocktwits', 'MSN', 'Seeking Alpha', 'The Motley Fool', 'Benzinga',
-        'InvestorPlace', 'Zacks', 'TipRanks', 'Finbold', 'CoinCentral'
-    }
-
     filtered = []
     for deal in unique_deals:
-        if any(ns.lower() in deal['source'].lower() for ns in noise_sources):
+        if NOISE_SOURCES_RE.search(deal['source']):
             continue
 
-        title = deal['title'].lower()
-        if any(skip in title for skip in [
-            'stock jumps', 'stock soars', 'shares surge', 'ipo', 'lawsuit', 'dividend',
-            'price target', 'earnings', 'fraud', 'downgrade', 'upgrade',
-            'luxury item', 'auction', 'resident buys', 'retail space'
-        ]):
+        if SKIP_TITLE_RE.search(deal['title']):
             continue
 
         filtered.append(deal)
@@ -211,31 +246,24 @@ def deduplicate_deals(deals):
     used = set()
     titles_normalized = [normalize(d['title']) for d in filtered]
 
+    similar_to = find_similar_pairs(titles_normalized)
+
     for i, base in enumerate(filtered):
         if i in used:
             continue
 
-        base_words, base_org = titles_normalized[i]
         similar = [base]
         used.add(i)
 
-        for j in range(i + 1, len(filtered)):
+        for j in similar_to[i]:
             if j in used:
                 continue
 
-            other_words, other_org = titles_normalized[j]
-            word_overlap = base_words & other_words
-            org_overlap = base_org & other_org
-
-            if len(word_overlap) >= 3 or len(org_overlap) >= 2:
-                similar.append(filtered[j])
-                used.add(j)
+            similar.append(filtered[j])
+            used.add(j)
 
         # Choose best source
-        def score(d):
-            return -preferred_sources.get(d['source'], 0), -len(d['title'])
-
-        best = sorted(similar, key=score)[0]
+        best = min(similar, key=source_score)
 
         if len(similar) > 1:
             best['related_sources'] = [
@@ -255,22 +283,29 @@ def deduplicate_deals(deals):
 
 # Main execution
 TODAY = datetime.utcnow()
+CUTOFF_TS = calendar.timegm(TODAY.utctimetuple()) - 86400
 deals = []
 
-for sector, query in sector_queries.items():
-    print(f"[📡] Searching Google News for: {sector}")
-    feed = google_news_rss(query)
-    
+print(f"[📡] Searching Google News for: {', '.join(sector_queries)}")
+feeds = asyncio.run(fetch_feeds(sector_queries))
+
+# Sector queries overlap heavily, so skip repeated articles before doing any work on them
+seen_links = set()
+
+for sector, feed in feeds.items():
     for entry in feed.entries:
-        title = html.unescape(entry.title)
-        link = entry.link
-        summary = html.unescape(entry.summary)
-        published = datetime(*entry.published_parsed[:6])
+        if entry.link in seen_links:
+            continue
+        seen_links.add(entry.link)
 
         # Filter by date (last 24h)
-        if (TODAY - published).total_seconds() > 86400:
+        if calendar.timegm(entry.published_parsed) < CUTOFF_TS:
             continue
 
+        title = html.unescape(entry.title)
+        link = entry.link
+        summary = html.unescape(entry.summary)
+
         # Get source name
         source = entry.get("source", {}).get("title", "Google News")
         
@@ -278,7 +313,7 @@ for sector, query in sector_queries.items():
             "title": title,
             "link": link,
             "summary": summary,
-            "date": published.strftime("%Y-%m-%d"),
+            "date": time.strftime("%Y-%m-%d", entry.published_parsed),
             "sector": sector,
             "source": source
         })
@@ -311,7 +346,7 @@ for deal in deals:
 deals = final_deals
 
 # Generate HTML output
-html_output = f"""<!DOCTYPE html>
+report_header = f"""<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
@@ -430,21 +465,26 @@ html_output = f"""<!DOCTYPE html>
         </div>
 """
 
-if not deals:
-    html_output += '<div class="no-deals">No relevant M&A deals found in the past 24 hours.</div>'
-else:
-    # Group by sector and display
-    sectors_in_order = ["Consumer & Retail", "Healthcare", "Technology", "Business Services"]
+# Stream the report into a fresh file; it replaces index.html once yesterday's
+# copy has been archived, so an archive hardlinked to it is never truncated
+with open("index.html.tmp", "w", encoding="utf-8", buffering=1 << 16) as f:
+    f.write(report_header)
+
+    if not deals:
+        f.write('<div class="no-deals">No relevant M&A deals found in the past 24 hours.</div>')
+    else:
+        # Group by sector and display
+        sectors_in_order = ["Consumer & Retail", "Healthcare", "Technology", "Business Services"]
     
-    for sector in sectors_in_order:
-        sector_deals = [d for d in deals if d["sector"] == sector]
-        if not sector_deals:
-            continue
+        for sector in sectors_in_order:
+            sector_deals = [d for d in deals if d["sector"] == sector]
+            if not sector_deals:
+                continue
             
-        html_output += f'<h2>{sector} ({len(sector_deals)} deals)</h2>'
+            f.write(f'<h2>{sector} ({len(sector_deals)} deals)</h2>')
         
-        for deal in sector_deals:
-            html_output += f'''
+            for deal in sector_deals:
+                f.write(f'''
             <div class="deal">
                 <div class="deal-title">
                     <a href="{deal['link']}" target="_blank">{deal['title']}</a>
@@ -452,28 +492,48 @@ else:
                 <div class="meta">
                     📅 {deal['date']} | 📰 {deal['source']}
                 </div>
-            '''
+            ''')
             
-            # Add related sources if any
-            if deal.get('related_sources'):
-                html_output += '<div class="related">'
-                html_output += '<div class="related-title">📄 Related Coverage:</div>'
-                for related in deal['related_sources']:
-                    html_output += f'''
+                # Add related sources if any
+                if deal.get('related_sources'):
+                    f.write('<div class="related">')
+                    f.write('<div class="related-title">📄 Related Coverage:</div>')
+                    for related in deal['related_sources']:
+                        f.write(f'''
                     <div class="related-item">
                         • <a href="{related['link']}" target="_blank">{related['title']}</a>
                         <em>({related['source']})</em>
                     </div>
-                    '''
-                html_output += '</div>'
+                    ''')
+                    f.write('</div>')
             
-            html_output += '</div>'
+                f.write('</div>')
 
-html_output += '''
+    f.write('''
     </div>
 </body>
 </html>
-'''
+''')
+
+# Dates with an archived report, newest first
+ARCHIVE_MANIFEST_PATH = "archives/manifest.json"
+
+def load_archive_manifest():
+    """Load archived dates, seeding the manifest from the archive directory on first run"""
+    if os.path.exists(ARCHIVE_MANIFEST_PATH):
+        with open(ARCHIVE_MANIFEST_PATH, encoding="utf-8") as f:
+            return json.load(f)
+
+    return sorted(
+        (
+            path.replace("archives/", "").replace(".html", "").replace("/", "-")
+            for path in glob("archives/*/*.html")
+            if "index.html" not in path
+        ),
+        reverse=True,
+    )
+
+archive_manifest = set(load_archive_manifest())
 
 # Archive yesterday's main index.html if it exists
 yesterday = TODAY - timedelta(days=1)
@@ -482,11 +542,11 @@ yesterday_archive_path = f"archives/{yesterday.strftime('%Y-%m')}/{yesterday.str
 if os.path.exists("index.html") and not os.path.exists(yesterday_archive_path):
     os.makedirs(os.path.dirname(yesterday_archive_path), exist_ok=True)
     os.rename("index.html", yesterday_archive_path)
+    archive_manifest.add(yesterday.strftime("%Y-%m-%d"))
     print(f"[📦] Archived yesterday's report to {yesterday_archive_path}")
 
 # Write output
-with open("index.html", "w", encoding="utf-8") as f:
-    f.write(html_output)
+os.replace("index.html.tmp", "index.html")
 
 print(f"[✅] Generated report with {len(deals)} deals saved to index.html")
 
@@ -494,11 +554,21 @@ archive_dir = f"archives/{TODAY.strftime('%Y-%m')}"
 archive_path = f"{archive_dir}/{TODAY.strftime('%d')}.html"
 
 os.makedirs(archive_dir, exist_ok=True)
-with open(archive_path, "w", encoding="utf-8") as f:
-    f.write(html_output)
+if os.path.exists(archive_path):
+    os.remove(archive_path)
+try:
+    os.link("index.html", archive_path)
+except OSError:
+    # Filesystem without hardlink support
+    shutil.copyfile("index.html", archive_path)
+archive_manifest.add(TODAY.strftime("%Y-%m-%d"))
 print(f"[🗂️] Saved archive to {archive_path}")
 
-archive_index_html = """<!DOCTYPE html>
+archive_dates = sorted(archive_manifest, reverse=True)
+with open(ARCHIVE_MANIFEST_PATH, "w", encoding="utf-8") as f:
+    json.dump(archive_dates, f, indent=2)
+
+archive_index_header = """<!DOCTYPE html>
 <html>
 <head>
     <meta charset="UTF-8">
@@ -516,17 +586,11 @@ archive_index_html = """<!DOCTYPE html>
     <h1>📚 M&A Archives</h1>
 """
 
-from glob import glob
-
-archive_index_html += "<ul>\n"
-for path in sorted(glob("archives/*/*.html"), reverse=True):
-    if "index.html" in path:
-        continue
-    date_str = path.replace("archives/", "").replace(".html", "").replace("/", "-")
-    rel_path = path.replace("archives/", "")
-    archive_index_html += f'<li><a href="{rel_path}">{date_str}</a></li>\n'
-archive_index_html += "</ul>\n</body></html>"
-
-with open("archives/index.html", "w", encoding="utf-8") as f:
-    f.write(archive_index_html)
+with open("archives/index.html", "w", encoding="utf-8", buffering=1 << 16) as f:
+    f.write(archive_index_header)
+    f.write("<ul>\n")
+    for date_str in archive_dates:
+        rel_path = f"{date_str[:7]}/{date_str[8:]}.html"
+        f.write(f'<li><a href="{rel_path}">{date_str}</a></li>\n')
+    f.write("</ul>\n</body></html>")
 print("[🧾] Updated archives index")